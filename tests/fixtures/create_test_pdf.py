@@ -18,52 +18,178 @@ from reportlab.lib.colors import (
 )
 from reportlab.lib.utils import ImageReader
 from PIL import Image
+import functools
 import io
+import sys
+import numpy as np
+
+# Layout constants shared by the page builders, computed once instead of
+# per draw call.
+WIDTH, HEIGHT = A4
+LEFT = 2 * cm
+LINE_H = 0.6 * cm
+HEADING_Y = HEIGHT - 3 * cm
+BODY_Y = HEIGHT - 5 * cm
+
+
+class TrackedCanvas:
+    """Canvas proxy that drops redundant setFont/setFillColor calls.
+
+    Re-setting an already-active font or fill color still emits a Tf/rg
+    operator, so the proxy remembers the current values and skips
+    no-op calls. Font and fill are part of the graphics state (and text
+    objects can change the font behind the canvas's back), so the cache
+    is invalidated on showPage, restoreState and drawText.
+    """
+
+    def __init__(self, c):
+        self._c = c
+        self._font = None
+        self._fill = None
+
+    def __getattr__(self, name):
+        return getattr(self._c, name)
+
+    def setFont(self, psfontname, size, leading=None):
+        key = (psfontname, size, leading)
+        if key != self._font:
+            self._c.setFont(psfontname, size, leading)
+            self._font = key
+
+    def setFillColor(self, color):
+        if color != self._fill:
+            self._c.setFillColor(color)
+            self._fill = color
+
+    def drawText(self, aTextObject):
+        self._font = None
+        self._fill = None
+        self._c.drawText(aTextObject)
+
+    def restoreState(self):
+        self._font = None
+        self._fill = None
+        self._c.restoreState()
+
+    def beginForm(self, name, lowerx=0, lowery=0, upperx=None, uppery=None):
+        self._font = None
+        self._fill = None
+        self._c.beginForm(name, lowerx, lowery, upperx, uppery)
+
+    def endForm(self):
+        self._font = None
+        self._fill = None
+        self._c.endForm()
+
+    def showPage(self):
+        self._font = None
+        self._fill = None
+        self._c.showPage()
+
+
+def create_test_pdf(filename: str, parallel: bool = False):
+    """Create a test PDF with outlines and images.
+
+    With parallel=True the independent pages are rendered in worker
+    processes and merged with pypdf; worth it only for much larger
+    fixture variants, since process spawn dominates at six pages.
+    """
+    if parallel:
+        create_pdf_parallel(filename)
+    else:
+        create_pdf_sequential(filename)
 
+    print(f"Created: {filename}")
+    print(f"  Pages: {len(PAGES)}")
+    print(f"  Bookmarks: {len(PAGES)}")
+    print("  Features: outlines, graphics, multi-page")
+
+
+def create_pdf_sequential(filename: str):
+    """Render all pages onto one canvas and save."""
+    # Hand the canvas an explicit 1MB-buffered file handle so save()
+    # streams the document with few syscalls instead of writing to a path
+    # it opens unbuffered itself.
+    out = open(filename, "wb", buffering=2**20)
+    c = TrackedCanvas(canvas.Canvas(out, pagesize=A4, pageCompression=1))
+
+    # Register each bookmark and its outline entry in one pass; the
+    # PAGES table is already the single source of truth for the
+    # hierarchy.
+    for title, key, level, builder in PAGES:
+        builder(c)
+        c.bookmarkPage(key)
+        c.addOutlineEntry(title, key, level=level)
+        c.showPage()
+
+    c.save()
+    out.close()
+
+
+def build_page(index: int) -> bytes:
+    """Render a single page as a standalone one-page PDF."""
+    _, _, _, builder = PAGES[index]
+    buf = io.BytesIO()
+    c = TrackedCanvas(canvas.Canvas(buf, pagesize=A4, pageCompression=1))
+    builder(c)
+    c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def create_pdf_parallel(filename: str):
+    """Render pages in worker processes and merge them with pypdf.
+
+    The pages share no canvas state, so each worker builds a one-page
+    document; the outline is re-attached by page number after the merge.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from pypdf import PdfWriter
+
+    with ProcessPoolExecutor() as pool:
+        pages = list(pool.map(build_page, range(len(PAGES))))
 
-def create_test_pdf(filename: str):
-    """Create a test PDF with outlines and images."""
-    c = canvas.Canvas(filename, pagesize=A4)
-    width, height = A4
+    writer = PdfWriter()
+    for data in pages:
+        writer.append(io.BytesIO(data))
+
+    parent = None
+    for page_num, (title, key, level, _) in enumerate(PAGES):
+        if level == 0:
+            parent = writer.add_outline_item(title, page_num)
+        else:
+            writer.add_outline_item(title, page_num, parent=parent)
+
+    with open(filename, "wb", buffering=2**20) as out:
+        writer.write(out)
 
-    # Track bookmarks for outline
-    bookmarks = []
 
-    # ========== Page 1: Title Page ==========
+def build_title_page(c):
+    """Page 1: Title Page."""
     c.setFont("Helvetica-Bold", 24)
-    c.drawCentredString(width / 2, height - 5 * cm, "MuPDF Test Document")
+    c.drawCentredString(WIDTH / 2, HEIGHT - 5 * cm, "MuPDF Test Document")
 
     c.setFont("Helvetica", 14)
-    c.drawCentredString(width / 2, height - 7 * cm, "A CC0 Public Domain PDF for Testing")
-    c.drawCentredString(width / 2, height - 8 * cm, "Contains: Outlines, Images, and Text")
+    c.drawCentredString(WIDTH / 2, HEIGHT - 7 * cm, "A CC0 Public Domain PDF for Testing")
+    c.drawCentredString(WIDTH / 2, HEIGHT - 8 * cm, "Contains: Outlines, Images, and Text")
 
     # Draw a colorful logo (simple geometric shapes as "image")
-    draw_logo(c, width / 2 - 3 * cm, height - 15 * cm, 6 * cm, 4 * cm)
+    draw_form(c, "logo", WIDTH / 2 - 3 * cm, HEIGHT - 15 * cm, 6 * cm, 4 * cm)
 
     # Embed a raster image (gradient pattern)
-    gradient_img = create_sample_image(200, 100, "gradient")
-    c.drawImage(image_to_reader(gradient_img), width / 2 - 3 * cm, height - 20 * cm,
+    c.drawImage(get_reader("gradient", 200, 100), WIDTH / 2 - 3 * cm, HEIGHT - 20 * cm,
                 width=6 * cm, height=3 * cm)
 
     c.setFont("Helvetica", 10)
-    c.drawCentredString(width / 2, 3 * cm, "This document is released under CC0 1.0 Universal (Public Domain)")
-    c.drawCentredString(width / 2, 2 * cm, "https://creativecommons.org/publicdomain/zero/1.0/")
+    c.drawCentredString(WIDTH / 2, 3 * cm, "This document is released under CC0 1.0 Universal (Public Domain)")
+    c.drawCentredString(WIDTH / 2, 2 * cm, "https://creativecommons.org/publicdomain/zero/1.0/")
 
-    # Add bookmark for title page
-    key1 = c.bookmarkPage("title")
-    bookmarks.append(("Title Page", "title", 0))
 
-    c.showPage()
-
-    # ========== Page 2: Chapter 1 ==========
+def build_chapter1(c):
+    """Page 2: Chapter 1."""
     c.setFont("Helvetica-Bold", 20)
-    c.drawString(2 * cm, height - 3 * cm, "Chapter 1: Introduction")
+    c.drawString(LEFT, HEADING_Y, "Chapter 1: Introduction")
 
-    key2 = c.bookmarkPage("chapter1")
-    bookmarks.append(("Chapter 1: Introduction", "chapter1", 0))
-
-    c.setFont("Helvetica", 12)
-    y = height - 5 * cm
     paragraphs = [
         "This is a test PDF document created for testing PDF reading capabilities.",
         "The document contains multiple features commonly found in real-world PDFs:",
@@ -75,24 +201,17 @@ def create_test_pdf(filename: str):
         "",
         "This file is specifically designed to test MuPDF-based PDF processing tools.",
     ]
-    for line in paragraphs:
-        c.drawString(2 * cm, y, line)
-        y -= 0.6 * cm
+    y = draw_text_block(c, LEFT, BODY_Y, paragraphs, "Helvetica", 12, LINE_H)
 
     # Draw some shapes as "images"
-    draw_shapes(c, 2 * cm, y - 5 * cm, 8 * cm, 4 * cm)
+    draw_form(c, "shapes", LEFT, y - 5 * cm, 8 * cm, 4 * cm)
 
-    c.showPage()
 
-    # ========== Page 3: Chapter 1.1 ==========
+def build_section1_1(c):
+    """Page 3: Chapter 1.1."""
     c.setFont("Helvetica-Bold", 18)
-    c.drawString(2 * cm, height - 3 * cm, "1.1 Background")
-
-    key3 = c.bookmarkPage("section1_1")
-    bookmarks.append(("1.1 Background", "section1_1", 1))  # nested under chapter 1
+    c.drawString(LEFT, HEADING_Y, "1.1 Background")
 
-    c.setFont("Helvetica", 12)
-    y = height - 5 * cm
     text = [
         "PDF (Portable Document Format) was developed by Adobe in the early 1990s.",
         "It has become the de facto standard for document exchange.",
@@ -103,21 +222,14 @@ def create_test_pdf(filename: str):
         "• Vector graphics support",
         "• Document security features",
     ]
-    for line in text:
-        c.drawString(2 * cm, y, line)
-        y -= 0.6 * cm
+    draw_text_block(c, LEFT, BODY_Y, text, "Helvetica", 12, LINE_H)
 
-    c.showPage()
 
-    # ========== Page 4: Chapter 1.2 ==========
+def build_section1_2(c):
+    """Page 4: Chapter 1.2."""
     c.setFont("Helvetica-Bold", 18)
-    c.drawString(2 * cm, height - 3 * cm, "1.2 MuPDF Library")
+    c.drawString(LEFT, HEADING_Y, "1.2 MuPDF Library")
 
-    key4 = c.bookmarkPage("section1_2")
-    bookmarks.append(("1.2 MuPDF Library", "section1_2", 1))
-
-    c.setFont("Helvetica", 12)
-    y = height - 5 * cm
     text = [
         "MuPDF is a lightweight PDF, XPS, and E-book viewer.",
         "It is developed by Artifex Software.",
@@ -128,57 +240,44 @@ def create_test_pdf(filename: str):
         "• Support for PDF, XPS, EPUB, and other formats",
         "• Extensive API for document manipulation",
     ]
-    for line in text:
-        c.drawString(2 * cm, y, line)
-        y -= 0.6 * cm
+    y = draw_text_block(c, LEFT, BODY_Y, text, "Helvetica", 12, LINE_H)
 
     # Add an image-like graphic
-    draw_chart(c, 2 * cm, y - 6 * cm, 10 * cm, 5 * cm)
+    draw_form(c, "chart", LEFT, y - 6 * cm, 10 * cm, 5 * cm)
 
-    c.showPage()
 
-    # ========== Page 5: Chapter 2 ==========
+def build_chapter2(c):
+    """Page 5: Chapter 2 (image gallery)."""
     c.setFont("Helvetica-Bold", 20)
-    c.drawString(2 * cm, height - 3 * cm, "Chapter 2: Image Gallery")
-
-    key5 = c.bookmarkPage("chapter2")
-    bookmarks.append(("Chapter 2: Image Gallery", "chapter2", 0))
+    c.drawString(LEFT, HEADING_Y, "Chapter 2: Image Gallery")
 
     c.setFont("Helvetica", 12)
-    c.drawString(2 * cm, height - 5 * cm, "This page contains various graphical elements:")
+    c.drawString(LEFT, BODY_Y, "This page contains various graphical elements:")
 
     # Embed raster images (different patterns)
-    gradient_img = create_sample_image(150, 100, "gradient")
-    c.drawImage(image_to_reader(gradient_img), 2 * cm, height - 10 * cm,
+    c.drawImage(get_reader("gradient", 150, 100), LEFT, HEIGHT - 10 * cm,
                 width=5 * cm, height=3 * cm)
-    c.drawString(2 * cm, height - 10.5 * cm, "Gradient Image")
+    c.drawString(LEFT, HEIGHT - 10.5 * cm, "Gradient Image")
 
-    checker_img = create_sample_image(150, 100, "checker")
-    c.drawImage(image_to_reader(checker_img), 8 * cm, height - 10 * cm,
+    c.drawImage(get_reader("checker", 150, 100), 8 * cm, HEIGHT - 10 * cm,
                 width=5 * cm, height=3 * cm)
-    c.drawString(8 * cm, height - 10.5 * cm, "Checkerboard Image")
+    c.drawString(8 * cm, HEIGHT - 10.5 * cm, "Checkerboard Image")
 
-    circles_img = create_sample_image(150, 100, "circles")
-    c.drawImage(image_to_reader(circles_img), 14 * cm, height - 10 * cm,
+    c.drawImage(get_reader("circles", 150, 100), 14 * cm, HEIGHT - 10 * cm,
                 width=5 * cm, height=3 * cm)
-    c.drawString(14 * cm, height - 10.5 * cm, "Circles Image")
+    c.drawString(14 * cm, HEIGHT - 10.5 * cm, "Circles Image")
 
     # Also draw vector graphics for comparison
-    draw_logo(c, 2 * cm, height - 17 * cm, 5 * cm, 4 * cm)
-    draw_shapes(c, 8 * cm, height - 17 * cm, 5 * cm, 4 * cm)
-    draw_chart(c, 2 * cm, height - 25 * cm, 11 * cm, 6 * cm)
+    draw_form(c, "logo", LEFT, HEIGHT - 17 * cm, 5 * cm, 4 * cm)
+    draw_form(c, "shapes", 8 * cm, HEIGHT - 17 * cm, 5 * cm, 4 * cm)
+    draw_form(c, "chart", LEFT, HEIGHT - 25 * cm, 11 * cm, 6 * cm)
 
-    c.showPage()
 
-    # ========== Page 6: Appendix ==========
+def build_appendix(c):
+    """Page 6: Appendix."""
     c.setFont("Helvetica-Bold", 20)
-    c.drawString(2 * cm, height - 3 * cm, "Appendix: License")
-
-    key6 = c.bookmarkPage("appendix")
-    bookmarks.append(("Appendix: License", "appendix", 0))
+    c.drawString(LEFT, HEADING_Y, "Appendix: License")
 
-    c.setFont("Helvetica", 11)
-    y = height - 5 * cm
     license_text = [
         "CC0 1.0 Universal (CC0 1.0) Public Domain Dedication",
         "",
@@ -193,45 +292,54 @@ def create_test_pdf(filename: str):
         "For more information:",
         "https://creativecommons.org/publicdomain/zero/1.0/",
     ]
-    for line in license_text:
-        c.drawString(2 * cm, y, line)
-        y -= 0.5 * cm
+    draw_text_block(c, LEFT, BODY_Y, license_text, "Helvetica", 11, 0.5 * cm)
 
-    c.showPage()
 
-    # ========== Create Outline ==========
-    # Build hierarchical outline
-    outline_items = []
-    parent_key = None
+# Page table: (outline title, bookmark key, outline level, builder).
+PAGES = [
+    ("Title Page", "title", 0, build_title_page),
+    ("Chapter 1: Introduction", "chapter1", 0, build_chapter1),
+    ("1.1 Background", "section1_1", 1, build_section1_1),
+    ("1.2 MuPDF Library", "section1_2", 1, build_section1_2),
+    ("Chapter 2: Image Gallery", "chapter2", 0, build_chapter2),
+    ("Appendix: License", "appendix", 0, build_appendix),
+]
 
-    for title, key, level in bookmarks:
-        if level == 0:
-            c.addOutlineEntry(title, key, level=0)
-        else:
-            c.addOutlineEntry(title, key, level=1)
 
-    c.save()
-    print(f"Created: {filename}")
-    print(f"  Pages: 6")
-    print(f"  Bookmarks: {len(bookmarks)}")
-    print("  Features: outlines, graphics, multi-page")
+def draw_text_block(c, x, y, lines, font, size, leading):
+    """Draw lines of text as a single text object.
+
+    One BT..ET block with textLine calls replaces per-line drawString,
+    which re-emits text state for every line. Returns the y position
+    below the last line.
+    """
+    t = c.beginText(x, y)
+    t.setFont(font, size)
+    t.setLeading(leading)
+    for line in lines:
+        t.textLine(line)
+    c.drawText(t)
+    return y - len(lines) * leading
 
 
 def draw_logo(c, x, y, w, h):
     """Draw a simple logo with overlapping shapes."""
+    cy = y + h * 0.5
+    r = h * 0.3
+
     # Background rectangle
     c.setFillColor(gray)
     c.rect(x, y, w, h, fill=1, stroke=0)
 
     # Overlapping circles
     c.setFillColor(red)
-    c.circle(x + w * 0.3, y + h * 0.5, h * 0.3, fill=1, stroke=0)
+    c.circle(x + w * 0.3, cy, r, fill=1, stroke=0)
 
     c.setFillColor(green)
-    c.circle(x + w * 0.5, y + h * 0.5, h * 0.3, fill=1, stroke=0)
+    c.circle(x + w * 0.5, cy, r, fill=1, stroke=0)
 
     c.setFillColor(blue)
-    c.circle(x + w * 0.7, y + h * 0.5, h * 0.3, fill=1, stroke=0)
+    c.circle(x + w * 0.7, cy, r, fill=1, stroke=0)
 
     # Text
     c.setFillColor(white)
@@ -239,20 +347,31 @@ def draw_logo(c, x, y, w, h):
     c.drawCentredString(x + w / 2, y + 0.3 * cm, "TEST LOGO")
 
 
+def draw_polygon(c, pts):
+    """Draw a closed filled polygon through pts as one path."""
+    path = c.beginPath()
+    path.moveTo(*pts[0])
+    for pt in pts[1:]:
+        path.lineTo(*pt)
+    path.close()
+    c.drawPath(path, fill=1, stroke=1)
+
+
 def draw_shapes(c, x, y, w, h):
     """Draw various geometric shapes."""
+    row_y = y + h * 0.6
+
     # Rectangle
     c.setFillColor(orange)
-    c.rect(x, y + h * 0.6, w * 0.3, h * 0.35, fill=1, stroke=1)
+    c.rect(x, row_y, w * 0.3, h * 0.35, fill=1, stroke=1)
 
     # Triangle
     c.setFillColor(purple)
-    path = c.beginPath()
-    path.moveTo(x + w * 0.35 + w * 0.15, y + h * 0.95)
-    path.lineTo(x + w * 0.35, y + h * 0.6)
-    path.lineTo(x + w * 0.65, y + h * 0.6)
-    path.close()
-    c.drawPath(path, fill=1, stroke=1)
+    draw_polygon(c, [
+        (x + w * 0.5, y + h * 0.95),
+        (x + w * 0.35, row_y),
+        (x + w * 0.65, row_y),
+    ])
 
     # Circle
     c.setFillColor(green)
@@ -264,15 +383,14 @@ def draw_shapes(c, x, y, w, h):
 
     # Star-like shape (diamond)
     c.setFillColor(red)
-    path = c.beginPath()
     cx, cy = x + w * 0.6, y + h * 0.27
     size = h * 0.2
-    path.moveTo(cx, cy + size)
-    path.lineTo(cx - size, cy)
-    path.lineTo(cx, cy - size)
-    path.lineTo(cx + size, cy)
-    path.close()
-    c.drawPath(path, fill=1, stroke=1)
+    draw_polygon(c, [
+        (cx, cy + size),
+        (cx - size, cy),
+        (cx, cy - size),
+        (cx + size, cy),
+    ])
 
 
 def draw_chart(c, x, y, w, h):
@@ -286,69 +404,148 @@ def draw_chart(c, x, y, w, h):
 
     # Bars
     bar_width = (w - 2 * cm) / 5
+    bar_positions = [x + 1.2 * cm + i * bar_width for i in range(5)]
+    bar_y = y + 0.2 * cm
+    bar_w = bar_width * 0.8
+    max_bar_h = h - 1 * cm
+    label_y = y - 0.3 * cm
     colors = [red, green, blue, orange, purple]
     heights = [0.7, 0.5, 0.9, 0.4, 0.6]
     labels = ["A", "B", "C", "D", "E"]
 
-    for i, (color, h_ratio, label) in enumerate(zip(colors, heights, labels)):
-        bar_x = x + 1.2 * cm + i * bar_width
-        bar_h = (h - 1 * cm) * h_ratio
+    # Draw all bars first, then all labels, so the black fill and label
+    # font are set once instead of per bar.
+    for bar_x, color, h_ratio in zip(bar_positions, colors, heights):
         c.setFillColor(color)
-        c.rect(bar_x, y + 0.2 * cm, bar_width * 0.8, bar_h, fill=1, stroke=1)
+        c.rect(bar_x, bar_y, bar_w, max_bar_h * h_ratio, fill=1, stroke=1)
 
-        # Label
-        c.setFillColor(black)
-        c.setFont("Helvetica", 8)
-        c.drawCentredString(bar_x + bar_width * 0.4, y - 0.3 * cm, label)
+    c.setFillColor(black)
+    t = c.beginText()
+    t.setFont("Helvetica", 8)
+    for bar_x, label in zip(bar_positions, labels):
+        t.setTextOrigin(bar_x + bar_width * 0.4 - c.stringWidth(label, "Helvetica", 8) / 2,
+                        label_y)
+        t.textOut(label)
+    c.drawText(t)
 
     # Title
     c.setFont("Helvetica-Bold", 10)
     c.drawCentredString(x + w / 2, y + h - 0.3 * cm, "Sample Chart")
 
 
-def create_sample_image(width: int, height: int, pattern: str = "gradient") -> Image.Image:
-    """Create a sample raster image programmatically."""
-    img = Image.new("RGB", (width, height), "white")
-    pixels = img.load()
-
+# Canonical geometry for the shared vector-graphic forms: drawing
+# function, width, height, and the bottom margin the content needs
+# below its origin (the chart's axis labels sit under y=0).
+FORMS = {
+    "logo": (draw_logo, 6 * cm, 4 * cm, 0),
+    "shapes": (draw_shapes, 8 * cm, 4 * cm, 0),
+    "chart": (draw_chart, 10 * cm, 5 * cm, 0.5 * cm),
+}
+
+
+def draw_form(c, name, x, y, w, h):
+    """Draw a vector graphic through a shared Form XObject.
+
+    The graphic is recorded once per canvas at its canonical size and
+    every placement just references it with a translate/scale, so pages
+    that repeat a graphic reuse one content stream instead of re-emitting
+    the path operators.
+    """
+    fn, fw, fh, pad = FORMS[name]
+    if not c.hasForm(name):
+        c.beginForm(name, lowerx=0, lowery=-pad, upperx=fw, uppery=fh)
+        fn(c, 0, 0, fw, fh)
+        c.endForm()
+    c.saveState()
+    c.translate(x, y)
+    c.scale(w / fw, h / fh)
+    c.doForm(name)
+    c.restoreState()
+
+
+@functools.lru_cache(maxsize=16)
+def _build_pattern(width: int, height: int, pattern: str) -> np.ndarray:
+    """Synthesize a pattern as a (height, width, 3) uint8 array.
+
+    The patterns are deterministic and tiny, so the arrays are cached at
+    module level and shared (read-only) across every PDF built in this
+    process.
+    """
     if pattern == "gradient":
         # Create a colorful gradient
-        for y in range(height):
-            for x in range(width):
-                r = int(255 * x / width)
-                g = int(255 * y / height)
-                b = int(255 * (1 - x / width))
-                pixels[x, y] = (r, g, b)
+        x = np.arange(width, dtype=np.float64)[None, :]
+        y = np.arange(height, dtype=np.float64)[:, None]
+        r = np.broadcast_to((255 * x / width).astype(np.uint8), (height, width))
+        g = np.broadcast_to((255 * y / height).astype(np.uint8), (height, width))
+        b = np.broadcast_to((255 * (1 - x / width)).astype(np.uint8), (height, width))
+        arr = np.dstack([r, g, b])
     elif pattern == "checker":
         # Create a checkerboard pattern
         cell_size = max(width, height) // 8
-        for y in range(height):
-            for x in range(width):
-                if ((x // cell_size) + (y // cell_size)) % 2 == 0:
-                    pixels[x, y] = (200, 50, 50)
-                else:
-                    pixels[x, y] = (50, 50, 200)
+        mask = (
+            (np.arange(width) // cell_size)[None, :]
+            + (np.arange(height) // cell_size)[:, None]
+        ) % 2 == 0
+        arr = np.where(mask[..., None], [200, 50, 50], [50, 50, 200]).astype(np.uint8)
     elif pattern == "circles":
         # Create concentric circles
         cx, cy = width // 2, height // 2
         max_r = min(width, height) // 2
-        for y in range(height):
-            for x in range(width):
-                dist = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
-                ring = int(dist / (max_r / 5)) % 3
-                colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255)]
-                pixels[x, y] = colors[ring]
+        xx = np.arange(width, dtype=np.float32)[None, :]
+        yy = np.arange(height, dtype=np.float32)[:, None]
+        dist = np.hypot(xx - cx, yy - cy)
+        ring = (dist / (max_r / 5)).astype(np.intp) % 3
+        palette = np.array([(255, 100, 100), (100, 255, 100), (100, 100, 255)], dtype=np.uint8)
+        # np.take skips the bounds checking that fancy indexing pays for
+        # on every lookup.
+        arr = np.take(palette, ring, axis=0, mode="wrap")
+    else:
+        arr = np.full((height, width, 3), 255, dtype=np.uint8)
+
+    arr = np.ascontiguousarray(arr)
+    arr.setflags(write=False)
+    return arr
+
+
+def create_sample_image(width: int, height: int, pattern: str = "gradient") -> Image.Image:
+    """Create a sample raster image programmatically."""
+    return Image.frombytes("RGB", (width, height),
+                           _build_pattern(width, height, pattern).tobytes())
 
-    return img
 
+def image_to_reader(img: Image.Image, fmt: str = "JPEG") -> ImageReader:
+    """Convert PIL Image to ReportLab ImageReader.
 
-def image_to_reader(img: Image.Image) -> ImageReader:
-    """Convert PIL Image to ReportLab ImageReader."""
+    fmt=None wraps the PIL image directly, skipping the encode here and
+    the matching decode inside ReportLab; JPEG is still encoded up front
+    because its DCT stream is embedded as-is and keeps the file small.
+    """
+    if fmt is None:
+        return ImageReader(img)
     buf = io.BytesIO()
-    img.save(buf, format="PNG")
+    if fmt == "JPEG":
+        img.save(buf, format="JPEG", quality=75, optimize=True)
+    else:
+        img.save(buf, format=fmt)
     buf.seek(0)
     return ImageReader(buf)
 
 
+@functools.lru_cache(maxsize=16)
+def get_reader(pattern: str, width: int, height: int) -> ImageReader:
+    """Return a memoized ImageReader for a sample pattern image.
+
+    drawImage registers image XObjects under a digest of their data, so
+    handing it the same ImageReader instance guarantees repeated draws of
+    a pattern share one embedded XObject across pages. Smooth patterns
+    compress better (and faster) as JPEG; the checkerboard is passed as a
+    raw PIL image (losslessly flate-compressed by ReportLab) so its hard
+    edges stay free of DCT ringing.
+    """
+    fmt = None if pattern == "checker" else "JPEG"
+    return image_to_reader(create_sample_image(width, height, pattern), fmt)
+
+
 if __name__ == "__main__":
-    create_test_pdf("test-with-outline-and-images.pdf")
+    create_test_pdf("test-with-outline-and-images.pdf",
+                    parallel="--parallel" in sys.argv)